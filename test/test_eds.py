@@ -1,3 +1,5 @@
+import copy
+import io
 import os
 import unittest
 import canopen
@@ -7,8 +9,12 @@ EDS_PATH = os.path.join(os.path.dirname(__file__), 'sample.eds')
 
 class TestEDS(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls._base_od = canopen.import_od(EDS_PATH, 2)
+
     def setUp(self):
-        self.od = canopen.import_od(EDS_PATH, 2)
+        self.od = self._base_od
 
     def test_load_nonexisting_file(self):
         with self.assertRaises(IOError):
@@ -121,72 +127,75 @@ class TestEDS(unittest.TestCase):
 """.strip())
 
     def test_export_eds(self):
-        import tempfile
-        from pathlib import Path
-        with tempfile.TemporaryDirectory() as tempdir:
-            for doctype in {"eds", "dcf"}:
-                tempfile = str(Path(tempdir, "test." + doctype))
-                with open(tempfile, "w+") as tempeds:
-                    print("exporting %s to " % doctype + tempeds.name)
-                    canopen.export_od(self.od, tempeds, doc_type=doctype)
-
-                exported_od = canopen.import_od(tempfile)
-
-                for index in exported_od:
-                    self.assertIn(exported_od[index].name, self.od)
-                    self.assertIn(index, self.od)
-
-                for index in self.od:
-                    if index < 0x0008:
-                        # ignore dummies
-                        continue
-                    self.assertIn(self.od[index].name, exported_od)
-                    self.assertIn(index, exported_od)
-
-                    actual_object = exported_od[index]
-                    expected_object = self.od[index]
-                    self.assertEqual(type(actual_object), type(expected_object))
-                    self.assertEqual(actual_object.name, expected_object.name)
-
-                    if isinstance(actual_object, canopen.objectdictionary.Variable):
-                        expected_vars = [expected_object]
-                        actual_vars = [actual_object]
-                    else:
-                        expected_vars = [expected_object[idx] for idx in expected_object]
-                        actual_vars = [actual_object[idx] for idx in actual_object]
-
-                    for prop in [
-                        "allowed_baudrates",
-                        "vendor_name",
-                        "vendor_number",
-                        "product_name",
-                        "product_number",
-                        "revision_number",
-                        "order_code",
-                        "simple_boot_up_master",
-                        "simple_boot_up_slave",
-                        "granularity",
-                        "dynamic_channels_supported",
-                        "group_messaging",
-                        "nr_of_RXPDO",
-                        "nr_of_TXPDO",
-                        "LSS_supported",
-                    ]:
-                        self.assertEqual(getattr(self.od.device_information, prop),
-                                         getattr(exported_od.device_information, prop),
-                                         f"prop {prop!r} mismatch on DeviceInfo")
-
-                    for evar, avar in zip(expected_vars, actual_vars):
-                        self.assertEqual(getattr(avar, "data_type", None), getattr(evar, "data_type", None),
-                                         " mismatch on %04X:%X" % (evar.index, evar.subindex))
-                        self.assertEqual(getattr(avar, "default_raw", None), getattr(evar, "default_raw", None),
-                                         " mismatch on %04X:%X" % (evar.index, evar.subindex))
-                        self.assertEqual(getattr(avar, "min", None), getattr(evar, "min", None),
+        self.od = copy.deepcopy(self._base_od)
+        for doctype in {"eds", "dcf"}:
+            buf = io.StringIO()
+            buf.name = "test." + doctype
+            canopen.export_od(self.od, buf, doc_type=doctype)
+            buf.seek(0)
+
+            exported_od = canopen.import_od(buf)
+
+            expected_by_index = {index: self.od[index] for index in self.od}
+            actual_by_index = {index: exported_od[index] for index in exported_od}
+            expected_names = {obj.name for obj in expected_by_index.values()}
+            actual_names = {obj.name for obj in actual_by_index.values()}
+
+            for index, actual_object in actual_by_index.items():
+                self.assertIn(actual_object.name, expected_names)
+                self.assertIn(index, expected_by_index)
+
+            exp_di = self.od.device_information
+            act_di = exported_od.device_information
+            for prop in [
+                "allowed_baudrates",
+                "vendor_name",
+                "vendor_number",
+                "product_name",
+                "product_number",
+                "revision_number",
+                "order_code",
+                "simple_boot_up_master",
+                "simple_boot_up_slave",
+                "granularity",
+                "dynamic_channels_supported",
+                "group_messaging",
+                "nr_of_RXPDO",
+                "nr_of_TXPDO",
+                "LSS_supported",
+            ]:
+                self.assertEqual(getattr(exp_di, prop), getattr(act_di, prop),
+                                 f"prop {prop!r} mismatch on DeviceInfo")
+
+            self.assertEqual(self.od.comments, exported_od.comments)
+
+            for index, expected_object in expected_by_index.items():
+                if index < 0x0008:
+                    # ignore dummies
+                    continue
+                self.assertIn(expected_object.name, actual_names)
+                self.assertIn(index, actual_by_index)
+
+                actual_object = actual_by_index[index]
+                self.assertEqual(type(actual_object), type(expected_object))
+                self.assertEqual(actual_object.name, expected_object.name)
+
+                if isinstance(actual_object, canopen.objectdictionary.Variable):
+                    expected_vars = [expected_object]
+                    actual_vars = [actual_object]
+                else:
+                    expected_vars = [expected_object[idx] for idx in expected_object]
+                    actual_vars = [actual_object[idx] for idx in actual_object]
+
+                for evar, avar in zip(expected_vars, actual_vars):
+                    self.assertEqual(getattr(avar, "data_type", None), getattr(evar, "data_type", None),
+                                     " mismatch on %04X:%X" % (evar.index, evar.subindex))
+                    self.assertEqual(getattr(avar, "default_raw", None), getattr(evar, "default_raw", None),
+                                     " mismatch on %04X:%X" % (evar.index, evar.subindex))
+                    self.assertEqual(getattr(avar, "min", None), getattr(evar, "min", None),
+                                     " mismatch on %04X:%X" % (evar.index, evar.subindex))
+                    self.assertEqual(getattr(avar, "max", None), getattr(evar, "max", None),
+                                     " mismatch on %04X:%X" % (evar.index, evar.subindex))
+                    if doctype == "dcf":
+                        self.assertEqual(getattr(avar, "value", None), getattr(evar, "value", None),
                                          " mismatch on %04X:%X" % (evar.index, evar.subindex))
-                        self.assertEqual(getattr(avar, "max", None), getattr(evar, "max", None),
-                                         " mismatch on %04X:%X" % (evar.index, evar.subindex))
-                        if doctype == "dcf":
-                            self.assertEqual(getattr(avar, "value", None), getattr(evar, "value", None),
-                                             " mismatch on %04X:%X" % (evar.index, evar.subindex))
-
-                        self.assertEqual(self.od.comments, exported_od.comments)